@@ -1,115 +1,558 @@
 """Structured JSON logging configuration."""
-import json
+import atexit
+import io
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
-import uuid
-from datetime import datetime, timezone
-from urllib.parse import urlparse, parse_qs, urlencode
+import threading
+import time
+from urllib.parse import unquote_plus
 from flask import request, has_request_context, g
 
+# Prefer orjson (Rust-based, much faster) for serialization, but fall back
+# to the stdlib so the module still works without the optional dependency.
+# _dumps returns bytes: records stay bytes all the way to the stream
+# buffer, so nothing is ever re-encoded to UTF-8 on the way out
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 
 # Service metadata
 SERVICE_NAME = os.getenv("SERVICE_NAME", "pricing-service")
 SERVICE_VERSION = os.getenv("SERVICE_VERSION", "1.0.0")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
+# The service metadata never changes after import, so serialize it once
+# and splice the fragment into every record instead of re-encoding the
+# same key-value pairs per log call. The trailing '}' is stripped so
+# the dynamic fields can be appended after it.
+_STATIC_PREFIX = _dumps({
+    "service": SERVICE_NAME,
+    "version": SERVICE_VERSION,
+    "environment": ENVIRONMENT,
+})[:-1]
+
+
+# Probe endpoints hammered by orchestrators; their access logs carry no
+# information and are suppressed, in the same spirit as silencing
+# werkzeug's INFO request logging
+_SKIP_PATHS = frozenset({'/health', '/metrics'})
+
+
+# Sensitive query parameter names to redact from logged paths
+_SENSITIVE_PARAMS = frozenset(
+    {'password', 'token', 'api_key', 'secret', 'authorization', 'credit_card'}
+)
+
+# Matches a sensitive key in query-key position; lets the overwhelmingly
+# common clean query string be rejected in a single C-level scan before
+# any pair-by-pair work
+_SENSITIVE_RE = re.compile(
+    r'(?i)[?&](?:' + '|'.join(sorted(_SENSITIVE_PARAMS)) + r')(?=[=&]|$)'
+)
+
 
 def sanitize_path(path):
     """Remove or redact sensitive query parameters from path."""
     if '?' not in path:
         return path
-    
-    parsed = urlparse(path)
-    query_params = parse_qs(parsed.query)
-    
-    # Sensitive parameter names to redact
-    sensitive_params = {'password', 'token', 'api_key', 'secret', 'authorization', 'credit_card'}
-    
-    # Redact sensitive parameters
-    sanitized = {}
-    for key, values in query_params.items():
-        if key.lower() in sensitive_params:
-            sanitized[key] = ['***REDACTED***']
-        else:
-            sanitized[key] = values
-    
-    # Reconstruct path with sanitized query
-    if sanitized:
-        sanitized_query = urlencode(sanitized, doseq=True)
-        return f"{parsed.path}?{sanitized_query}"
-    return parsed.path
 
+    # Percent-encoded keys (e.g. ?%74oken=...) must not slip past the
+    # prefilter or the key comparison, so decode before matching — but
+    # only when an escape is actually present, keeping the common clean
+    # query allocation-free
+    if _SENSITIVE_RE.search(
+        unquote_plus(path) if '%' in path or '+' in path else path
+    ) is None:
+        return path
 
-def get_correlation_id():
+    # A sensitive key is present: scan the query pair by pair and rebuild
+    # it with the matching values redacted
+    prefix, _, query = path.partition('?')
+    pairs = query.split('&')
+    redacted = False
+    for i, pair in enumerate(pairs):
+        key = pair.partition('=')[0]
+        if '%' in key or '+' in key:
+            key = unquote_plus(key)
+        if key.lower() in _SENSITIVE_PARAMS:
+            pairs[i] = key + '=***REDACTED***'
+            redacted = True
+
+    if not redacted:
+        return path
+    return prefix + '?' + '&'.join(pairs)
+
+
+def _logged_path(req):
+    """Path to record for a request, sanitized when it has a query string.
+
+    Without a query string, req.path is returned directly — that skips
+    Werkzeug's full_path reconstruction, the trailing-'?' strip and the
+    sanitize call entirely.
+    """
+    if not req.query_string:
+        return req.path
+    return sanitize_path(req.full_path)
+
+
+try:
+    from flask.globals import _cv_request
+
+    def _current_request():
+        """Concrete request object, or None outside a request context.
+
+        A single ContextVar read; attribute access on the returned object
+        is direct, bypassing the LocalProxy dispatch that every use of
+        `request` and `has_request_context()` pays.
+        """
+        ctx = _cv_request.get(None)
+        return ctx.request if ctx is not None else None
+except ImportError:  # Flask < 2.2 keeps the context on a stack instead
+    def _current_request():
+        return request._get_current_object() if has_request_context() else None
+
+
+def get_correlation_id(req=None):
     """Get or create correlation ID for the current request."""
-    if not has_request_context():
-        return None
-    
+    if req is None:
+        req = _current_request()
+        if req is None:
+            return None
+
     # Try to get from Flask's g object
     if hasattr(g, 'correlation_id'):
         return g.correlation_id
-    
+
     # Try to get from request headers (passed from other services)
-    correlation_id = request.headers.get('X-Correlation-ID') or request.headers.get('X-Request-ID')
+    correlation_id = req.headers.get('X-Correlation-ID') or req.headers.get('X-Request-ID')
     
-    # Generate new one if not found
+    # Generate new one if not found. os.urandom(16).hex() is a single C
+    # call, skipping the uuid.UUID object that str(uuid.uuid4()) builds;
+    # hyphens are spliced in so the ID still looks like a UUID downstream
     if not correlation_id:
-        correlation_id = str(uuid.uuid4())
+        h = os.urandom(16).hex()
+        correlation_id = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
     
     # Store in g for this request
     g.correlation_id = correlation_id
     return correlation_id
 
 
+# Attributes present on every LogRecord (snapshotted from a blank record)
+# plus fields the formatter already emits explicitly; anything else on a
+# record is a caller-supplied extra
+_BUILTIN_KEYS = frozenset(
+    logging.LogRecord('', 0, '', 0, '', None, None).__dict__
+) | {'message', 'asctime', 'correlation_id', 'endpoint', 'taskName',
+     '_request_snapshot'}
+
+
+# Timestamp cache: [epoch second, formatted prefix through the decimal
+# point]. The prefix only changes once per second, so gmtime runs at most
+# once per second no matter how many records are logged
+_ts_cache = [0, b""]
+
+
+def _format_timestamp(created):
+    """Format an epoch timestamp as UTC RFC 3339 with millisecond precision.
+
+    Formats directly from the float with %-interpolation — no datetime
+    object and no strftime format parsing per record. Returns bytes, like
+    everything else on the output path.
+    """
+    sec = int(created)
+    if sec != _ts_cache[0]:
+        _ts_cache[1] = b"%04d-%02d-%02dT%02d:%02d:%02d." % time.gmtime(sec)[:6]
+        _ts_cache[0] = sec
+    return _ts_cache[1] + b"%03dZ" % int((created - sec) * 1000)
+
+
+def _build_fast_format():
+    """Compile a formatter specialized for the common record shape.
+
+    Most records carry no exception and no extras, so their JSON layout
+    is fixed. Generate a function with the service metadata and key names
+    inlined as string literals and compile it once at import; values that
+    may contain arbitrary text still pass through _dumps for escaping.
+    """
+    prefix = _STATIC_PREFIX + b','
+    src = f"""\
+def _fast_format(record, snapshot, correlation_id,
+                 _dumps=_dumps, _ts=_format_timestamp):
+    out = ({prefix!r}
+           + b'"timestamp":"' + _ts(record.created)
+           + b'","level":"' + record.levelname.encode()
+           + b'","logger":' + _dumps(record.name)
+           + b',"message":' + _dumps(record.getMessage())
+           + b',"module":' + _dumps(record.module)
+           + b',"function":' + _dumps(record.funcName)
+           + b',"line":%d' % record.lineno)
+    if correlation_id:
+        out += b',"correlation_id":' + _dumps(correlation_id)
+    if snapshot is not None:
+        out += b',"request":' + _dumps(snapshot)
+    return out + b'}}'
+"""
+    namespace = {'_dumps': _dumps, '_format_timestamp': _format_timestamp}
+    exec(compile(src, '<fast_format>', 'exec'), namespace)
+    return namespace['_fast_format']
+
+
+_fast_format = _build_fast_format()
+
+# Reusable log_data template so the generic path updates values in place
+# instead of rebuilding the dict (and re-hashing every static key) per
+# record. Thread-local for safety, although in practice only the queue
+# listener thread formats records
+_template = threading.local()
+
+
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
     def format(self, record):
-        log_data = {
-            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "level": record.levelname,
-            "service": SERVICE_NAME,
-            "version": SERVICE_VERSION,
-            "environment": ENVIRONMENT,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
-
-        # Add correlation ID if available
-        correlation_id = get_correlation_id()
+        # Correlation ID and request context: snapshotted by the queue
+        # handler, or read from the live request context
+        correlation_id = getattr(record, 'correlation_id', None) or get_correlation_id()
+        snapshot = getattr(record, '_request_snapshot', None)
+        if snapshot is None:
+            req = _current_request()
+            if req is not None:
+                snapshot = {
+                    "method": req.method,
+                    "path": _logged_path(req),
+                    "endpoint": req.endpoint,
+                }
+
+        # Common shape (no exception, no extras): use the compiled
+        # specialized formatter and skip dict construction entirely
+        if record.exc_info is None and not (record.__dict__.keys() - _BUILTIN_KEYS):
+            return _fast_format(record, snapshot, correlation_id)
+
+        try:
+            log_data = _template.data
+        except AttributeError:
+            log_data = _template.data = {}
+        # The cached timestamp is bytes; the dict path needs str since
+        # the JSON encoder rejects bytes values
+        log_data["timestamp"] = _format_timestamp(record.created).decode()
+        log_data["level"] = record.levelname
+        log_data["logger"] = record.name
+        log_data["message"] = record.getMessage()
+        log_data["module"] = record.module
+        log_data["function"] = record.funcName
+        log_data["line"] = record.lineno
+
+        # Optional fields are popped when absent so values from the
+        # previous record never leak into this one
         if correlation_id:
             log_data["correlation_id"] = correlation_id
+        else:
+            log_data.pop("correlation_id", None)
 
-        # Add exception info if present
+        # Add exception info if present. Traceback rendering is memoized
+        # on the record via exc_text, so a record handled by several
+        # handlers only pays for it once
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
+        else:
+            log_data.pop("exception", None)
 
         # Add request context if available
-        if has_request_context():
-            log_data["request"] = {
-                "method": request.method,
-                "path": sanitize_path(request.full_path.rstrip('?')),
-                "endpoint": request.endpoint,
+        if snapshot is not None:
+            log_data["request"] = snapshot
+        else:
+            log_data.pop("request", None)
+
+        # Add any extra fields from the log record. The set difference runs
+        # at C level and is empty for records without extras; call sites
+        # drop None values up front (see log_event) so the loop body is
+        # branch-free. Extras go into a copy so the template's key set
+        # stays fixed
+        extras = record.__dict__.keys() - _BUILTIN_KEYS
+        if extras:
+            log_data = dict(log_data)
+            record_dict = record.__dict__
+            for key in extras:
+                log_data[key] = record_dict[key]
+
+        # Splice the pre-serialized service metadata in front of the
+        # dynamic fields
+        return _STATIC_PREFIX + b"," + _dumps(log_data)[1:]
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that snapshots Flask request context before enqueueing.
+
+    Records are formatted on the listener thread, where the Flask request
+    context is no longer available. Capture the correlation ID and request
+    details here (cheap attribute reads) so the formatter can use them later;
+    the expensive JSON serialization and stdout I/O stay off the request
+    thread.
+    """
+
+    def prepare(self, record):
+        # Merge args into the message now; the originals may be mutated
+        # by the caller after this method returns
+        record.msg = record.getMessage()
+        record.args = None
+        req = _current_request()
+        if req is not None:
+            if getattr(record, 'correlation_id', None) is None:
+                record.correlation_id = get_correlation_id(req)
+            record._request_snapshot = {
+                "method": req.method,
+                "path": _logged_path(req),
+                "endpoint": req.endpoint,
             }
+        return record
+
+
+class BufferedStreamHandler(logging.Handler):
+    """Stream handler that buffers writes to cut down on syscalls.
+
+    Each StreamHandler.emit normally ends in its own write() + flush()
+    syscall, which dominates logging cost under load. This handler writes
+    into a 64 KB io.BufferedWriter instead, so records are flushed to the
+    underlying file descriptor in large chunks. A background thread
+    flushes the buffer periodically so entries never sit unflushed for
+    long.
+    """
+
+    FLUSH_INTERVAL = 0.05  # seconds
+
+    def __init__(self, stream=None, buffer_size=65536):
+        super().__init__()
+        if stream is None:
+            stream = sys.stdout
+        # Wrap the raw file object, not sys.stdout.buffer: when stdout is
+        # block-buffered (PYTHONUNBUFFERED unset, as in the container),
+        # that is itself an 8 KB BufferedWriter, and flushing our buffer
+        # into it would leave records stranded there until it fills
+        raw = getattr(stream, 'buffer', stream)
+        raw = getattr(raw, 'raw', raw)
+        self.buffer = io.BufferedWriter(raw, buffer_size=buffer_size)
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name='log-flusher', daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def emit(self, record):
+        try:
+            # JSONFormatter returns bytes; write them straight into the
+            # buffer with no UTF-8 re-encode
+            msg = self.format(record)
+            with self.lock:
+                self.buffer.write(msg + b"\n")
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            self.buffer.flush()
+
+    def close(self):
+        self._stop_event.set()
+        self.flush()
+        super().close()
+
+    def emit_batch(self, records):
+        """Emit several records with a single buffered write."""
+        parts = []
+        for record in records:
+            try:
+                parts.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if parts:
+            with self.lock:
+                self.buffer.write(b"\n".join(parts) + b"\n")
+
+    def _flush_loop(self):
+        """Periodically flush so buffered records reach stdout promptly."""
+        while not self._stop_event.wait(self.FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except ValueError:
+                # Stream was closed during interpreter shutdown
+                break
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that drains queued records in batches.
+
+    Under a burst, handing up to MAX_BATCH records to the handler as one
+    newline-delimited blob amortizes lock and write cost across the batch
+    instead of paying it once per record.
+    """
+
+    MAX_BATCH = 256
+
+    def _monitor(self):
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        stopping = False
+        while not stopping:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = []
+            for record in batch:
+                if record is self._sentinel:
+                    stopping = True
+                else:
+                    records.append(record)
+                if has_task_done:
+                    q.task_done()
+            if records:
+                self.handle_batch(records)
+
+    def handle_batch(self, records):
+        """Pass a batch of records to every handler."""
+        for handler in self.handlers:
+            if self.respect_handler_level:
+                wanted = [r for r in records if r.levelno >= handler.level]
+            else:
+                wanted = records
+            if not wanted:
+                continue
+            if hasattr(handler, 'emit_batch'):
+                handler.emit_batch(wanted)
+            else:
+                for record in wanted:
+                    handler.handle(record)
+
+
+class CoalesceFilter(logging.Filter):
+    """Collapse bursts of identical log messages.
+
+    Burst-prone background logging (startup spam, retry loops, worker
+    ticks) can emit the same record many times per second, each differing
+    only in timestamp. The first occurrence in a window passes through;
+    repeats within WINDOW seconds are suppressed and counted. When a
+    window expires its count is reported: folded into the next identical
+    record if one arrives, otherwise emitted as a summary record when any
+    later record passes through, so suppressed bursts are never silently
+    dropped.
+
+    Records logged inside a request context, or carrying extra fields,
+    are never coalesced: correlation ID, path and extras make them
+    distinct per request, and suppressing them would destroy access
+    logging for ordinary traffic.
+    """
+
+    WINDOW = 1.0
+    MAX_KEYS = 1024
+
+    def __init__(self, handler=None):
+        super().__init__()
+        # Handler that receives synthesized summary records; they go
+        # through emit() directly, which bypasses this filter
+        self._handler = handler
+        # (logger, level, msg, args) -> [window start, suppressed count];
+        # filter() runs on concurrent request threads, so all access is
+        # serialized by the lock
+        self._lock = threading.Lock()
+        self._seen = {}
+        self._last_sweep = 0.0
+
+    def filter(self, record):
+        # Request-scoped records and records with extras are never
+        # "identical except timestamp"; pass them straight through
+        if _current_request() is not None or record.__dict__.keys() - _BUILTIN_KEYS:
+            return True
 
-        # Add any extra fields from the log record
-        # Skip built-in fields and redundant/null fields
-        reserved_attrs = {
-            'name', 'msg', 'args', 'created', 'filename', 'funcName', 'levelname',
-            'levelno', 'lineno', 'module', 'msecs', 'message', 'pathname', 'process',
-            'processName', 'relativeCreated', 'thread', 'threadName', 'exc_info',
-            'exc_text', 'stack_info', 'correlation_id', 'endpoint', 'taskName'
-        }
-        
-        for key, value in record.__dict__.items():
-            if key not in reserved_attrs and not key.startswith('_') and value is not None:
-                log_data[key] = value
+        key = (record.name, record.levelno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable args (e.g. a dict); don't coalesce this record
+            return True
 
-        return json.dumps(log_data)
+        now = record.created
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.WINDOW:
+                entry[1] += 1
+                return False
+
+            suppressed = entry[1] if entry is not None else 0
+            self._seen[key] = [now, 0]
+
+            expired = ()
+            if now - self._last_sweep >= self.WINDOW or len(self._seen) > self.MAX_KEYS:
+                expired = self._sweep(now)
+
+        # Summaries for other keys whose windows expired without a
+        # recurrence; emitted outside the lock
+        for expired_key, count in expired:
+            self._emit_summary(expired_key, count)
+
+        if suppressed:
+            # This key's window closed with suppressed repeats: report
+            # them on this record instead of a separate summary
+            record.msg = "%s (x%d in last %.0fs)" % (
+                record.getMessage(), suppressed, self.WINDOW
+            )
+            record.args = None
+        return True
+
+    def _sweep(self, now):
+        """Drop expired windows, returning those with pending counts."""
+        self._last_sweep = now
+        cutoff = now - self.WINDOW
+        pending = []
+        for key, entry in list(self._seen.items()):
+            if entry[0] < cutoff:
+                del self._seen[key]
+                if entry[1]:
+                    pending.append((key, entry[1]))
+        return pending
+
+    def flush_pending(self):
+        """Emit summaries for every window still holding a suppressed count.
+
+        Called at shutdown: without this, counts pending when logging goes
+        quiet would be lost, since sweeps only run when a record passes.
+        """
+        with self._lock:
+            pending = [(key, entry[1]) for key, entry in self._seen.items()
+                       if entry[1]]
+            self._seen.clear()
+        for key, count in pending:
+            self._emit_summary(key, count)
+
+    def _emit_summary(self, key, count):
+        """Synthesize and emit an aggregate record for a closed window."""
+        if self._handler is None:
+            return
+        name, levelno, msg, args = key
+        record = logging.LogRecord(
+            name, levelno, __file__, 0, msg, args, None, func='<coalesced>'
+        )
+        record.msg = "%s (x%d in last %.0fs)" % (
+            record.getMessage(), count, self.WINDOW
+        )
+        record.args = None
+        self._handler.emit(record)
 
 
 def setup_logging():
@@ -124,10 +567,27 @@ def setup_logging():
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Add stdout handler with JSON formatter
-    stdout_handler = logging.StreamHandler(sys.stdout)
+    # Request threads only enqueue records; a background listener thread
+    # owns the JSON formatting and the buffered stdout writes
+    stdout_handler = BufferedStreamHandler(sys.stdout)
     stdout_handler.setFormatter(json_formatter)
-    root_logger.addHandler(stdout_handler)
+
+    # Coalescing runs on the queue handler so suppressed duplicates never
+    # even reach the queue
+    log_queue = queue.Queue(-1)
+    queue_handler = ContextQueueHandler(log_queue)
+    coalesce_filter = CoalesceFilter(queue_handler)
+    queue_handler.addFilter(coalesce_filter)
+    root_logger.addHandler(queue_handler)
+
+    listener = BatchingQueueListener(
+        log_queue, stdout_handler, respect_handler_level=True
+    )
+    listener.start()
+    # atexit runs LIFO: pending coalesce summaries are enqueued first,
+    # then the listener drains the queue, then the stream buffer flushes
+    atexit.register(listener.stop)
+    atexit.register(coalesce_filter.flush_pending)
     
     # Disable werkzeug's default request logging (we handle this ourselves)
     werkzeug_logger = logging.getLogger('werkzeug')
@@ -139,6 +599,19 @@ def get_logger(name):
     return logging.getLogger(name)
 
 
+def log_event(logger, level, msg, *args, **fields):
+    """Log with extra fields, dropping None values at the call site.
+
+    Filtering Nones here (and only when the level is enabled) keeps the
+    per-key null checks out of the formatter's extras loop.
+    """
+    if logger.isEnabledFor(level):
+        # stacklevel=2 keeps module/function/line pointing at the caller
+        # rather than this helper frame
+        logger.log(level, msg, *args, stacklevel=2,
+                   extra={k: v for k, v in fields.items() if v is not None})
+
+
 def setup_request_logging(app):
     """Set up before/after request logging for the Flask app."""
     logger = get_logger('app.request')
@@ -146,33 +619,40 @@ def setup_request_logging(app):
     @app.before_request
     def log_request_start():
         """Log incoming requests and ensure correlation ID is set."""
+        req = _current_request()
+        if req.path in _SKIP_PATHS:
+            return
+
         # Ensure correlation ID is initialized
-        correlation_id = get_correlation_id()
-        
-        logger.info(
-            "Request received",
-            extra={
-                "correlation_id": correlation_id,
-                "endpoint": request.endpoint
-            }
+        correlation_id = get_correlation_id(req)
+
+        log_event(
+            logger, logging.INFO, "Request received",
+            correlation_id=correlation_id,
+            endpoint=req.endpoint,
         )
-    
+
     @app.after_request
     def log_request_end(response):
         """Log request completion with status code."""
-        correlation_id = get_correlation_id()
-        
-        logger.info(
-            f"Request completed with status {response.status_code}",
-            extra={
-                "correlation_id": correlation_id,
-                "status_code": response.status_code
-            }
+        req = _current_request()
+        if req.path in _SKIP_PATHS:
+            return response
+
+        correlation_id = get_correlation_id(req)
+
+        # %s-style args defer string formatting until the record is
+        # actually emitted, so a raised log level skips it entirely
+        log_event(
+            logger, logging.INFO, "Request completed with status %s",
+            response.status_code,
+            correlation_id=correlation_id,
+            status_code=response.status_code,
         )
-        
+
         # Add correlation ID to response headers for client tracking
         response.headers['X-Correlation-ID'] = correlation_id
-        
+
         return response
     
     @app.teardown_request
@@ -180,7 +660,8 @@ def setup_request_logging(app):
         """Log any unhandled exceptions."""
         if exception:
             logger.error(
-                f"Unhandled exception: {str(exception)}",
+                "Unhandled exception: %s",
+                exception,
                 exc_info=True,
                 extra={"correlation_id": get_correlation_id()}
             )